@@ -2,21 +2,168 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
 import random
 
 from .settings import AIDifficulty
-from .utils import DIRECTIONS, Direction, Position, add_direction, in_bounds, is_opposite
+from .utils import (
+    DIRECTIONS,
+    GRID_SIZE,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+    Direction,
+    Position,
+    add_direction,
+    is_opposite,
+)
+
+GRID_W = SCREEN_WIDTH // GRID_SIZE
+GRID_H = SCREEN_HEIGHT // GRID_SIZE
+
+# The grid carries a one-cell sentinel border marked occupied, so stepping
+# off the board reads as blocked and the hot loops need no bounds checks.
+PAD_W = GRID_W + 2
+PAD_H = GRID_H + 2
+
+# Non-reversing successors per incoming direction, so the safety scan never
+# has to call is_opposite in the per-tick loop.
+ALLOWED_NEXT: dict[Direction, tuple[Direction, ...]] = {
+    d: tuple(x for x in DIRECTIONS if not is_opposite(x, d)) for d in DIRECTIONS
+}
+
+# Cumulative linear offsets for the four-cell safety corridor ahead of each
+# direction, so the look-ahead walk is pure adds against precomputed strides.
+LOOKAHEAD_OFFSETS: dict[Direction, tuple[int, ...]] = {
+    d: tuple((d[1] * PAD_W + d[0]) * k for k in range(1, 5)) for d in DIRECTIONS
+}
+
+
+def pack_cell(x: int, y: int) -> int:
+    """Pack a pixel position into a linear index on the padded cell grid."""
+    return (y // GRID_SIZE + 1) * PAD_W + (x // GRID_SIZE + 1)
+
+
+def _flood_fill_py(grid: bytearray, seeds: list[int], cap: int, visited: list[int], gen: int) -> int:
+    """Count cells reachable from the seed cells, up to a budget of cap.
+
+    ``visited`` is a reusable scratch buffer stamped with the caller's
+    generation counter, so no per-call set allocation or clearing happens.
+    The walk is depth-first: only the reachable-cell count matters, not
+    visit order, and popping from the list tail is O(1).
+    """
+    frontier = list(seeds)
+    for idx in frontier:
+        visited[idx] = gen
+    score = len(frontier)
+    append = frontier.append
+    # The four neighbor probes are unrolled: with only four fixed deltas the
+    # iterator setup per pop costs more than the straight-line checks, and
+    # the sentinel border makes every index valid without edge tests.
+    while frontier and score < cap:
+        current = frontier.pop()
+        nxt = current - PAD_W
+        if visited[nxt] != gen and not grid[nxt]:
+            visited[nxt] = gen
+            append(nxt)
+            score += 1
+        nxt = current + PAD_W
+        if visited[nxt] != gen and not grid[nxt]:
+            visited[nxt] = gen
+            append(nxt)
+            score += 1
+        nxt = current - 1
+        if visited[nxt] != gen and not grid[nxt]:
+            visited[nxt] = gen
+            append(nxt)
+            score += 1
+        nxt = current + 1
+        if visited[nxt] != gen and not grid[nxt]:
+            visited[nxt] = gen
+            append(nxt)
+            score += 1
+    return score
+
+
+try:  # pragma: no cover - exercised only with the optional accel extra
+    import numpy as _np
+    from numba import njit as _njit
+except ImportError:
+    _np = None
+    _njit = None
+
+if _njit is not None:  # pragma: no cover
+
+    @_njit(cache=True)
+    def _flood_fill_jit(grid, seeds, cap, pad_w):  # type: ignore[no-redef]
+        n = grid.shape[0]
+        queue = _np.empty(n, dtype=_np.int64)
+        visited = _np.zeros(n, dtype=_np.uint8)
+        tail = 0
+        for i in range(seeds.shape[0]):
+            queue[tail] = seeds[i]
+            visited[seeds[i]] = 1
+            tail += 1
+        head = 0
+        while head < tail and tail < cap:
+            current = queue[head]
+            head += 1
+            for delta in (-pad_w, pad_w, -1, 1):
+                nxt = current + delta
+                if visited[nxt] == 0 and grid[nxt] == 0:
+                    visited[nxt] = 1
+                    queue[tail] = nxt
+                    tail += 1
+        return tail
+
+    def _flood_fill(grid: bytearray, seeds: list[int], cap: int, visited: list[int], gen: int) -> int:
+        # The compiled kernel tracks visited cells in its own typed array.
+        return int(
+            _flood_fill_jit(
+                _np.frombuffer(bytes(grid), dtype=_np.uint8),
+                _np.asarray(seeds, dtype=_np.int64),
+                cap,
+                PAD_W,
+            )
+        )
+
+else:
+    _flood_fill = _flood_fill_py
 
 
-@dataclass(slots=True)
 class GameSnapshot:
-    """Small, testable snapshot of board state for AI."""
+    """Small, testable snapshot of board state for AI.
+
+    A plain ``__slots__`` class rather than a dataclass: snapshots are
+    rebuilt every simulation tick and the generated dataclass ``__init__``
+    is measurably slower to call.
+    """
 
-    ai_position: Position
-    ai_direction: Direction
-    opponent_position: Position
-    occupied: set[Position]
+    __slots__ = ("ai_position", "ai_direction", "opponent_position", "occupied", "grid")
+
+    def __init__(
+        self,
+        ai_position: Position,
+        ai_direction: Direction,
+        opponent_position: Position,
+        occupied: set[Position],
+    ) -> None:
+        self.ai_position = ai_position
+        self.ai_direction = ai_direction
+        self.opponent_position = opponent_position
+        self.occupied = occupied
+        # Pack the occupied set into a flat cell grid once so the AI hot
+        # loops probe a single byte instead of hashing position tuples.
+        grid = bytearray(PAD_W * PAD_H)
+        grid[:PAD_W] = b"\x01" * PAD_W
+        grid[-PAD_W:] = b"\x01" * PAD_W
+        for base in range(PAD_W, PAD_W * (PAD_H - 1), PAD_W):
+            grid[base] = 1
+            grid[base + PAD_W - 1] = 1
+        for x, y in self.occupied:
+            cx = x // GRID_SIZE
+            cy = y // GRID_SIZE
+            if 0 <= cx < GRID_W and 0 <= cy < GRID_H:
+                grid[(cy + 1) * PAD_W + cx + 1] = 1
+        self.grid = grid
 
 
 class TronAI:
@@ -24,92 +171,133 @@ class TronAI:
 
     def __init__(self, difficulty: AIDifficulty) -> None:
         self.difficulty = difficulty
+        self._rng = random.Random()
+        self._visited_scratch = [0] * (PAD_W * PAD_H)
+        self._visited_gen = 0
+        self._choose_impl = {
+            AIDifficulty.EASY: self._easy,
+            AIDifficulty.MEDIUM: self._medium,
+            AIDifficulty.HARD: self._hard,
+        }[difficulty]
+        self.should_shoot = {
+            AIDifficulty.EASY: self._shoot_never,
+            AIDifficulty.MEDIUM: self._shoot_medium,
+            AIDifficulty.HARD: self._shoot_hard,
+        }[difficulty]
 
     def choose_direction(self, snapshot: GameSnapshot) -> Direction:
         """Choose next direction according to configured difficulty."""
-        if self.difficulty == AIDifficulty.EASY:
-            return self._easy(snapshot)
-        if self.difficulty == AIDifficulty.MEDIUM:
-            return self._medium(snapshot)
-        return self._hard(snapshot)
-
-    def should_shoot(self, snapshot: GameSnapshot, ammo: int) -> bool:
-        """Use weapons aggressively on hard, opportunistically on medium."""
-        if ammo <= 0:
-            return False
-        aligned = (
+        return self._choose_impl(snapshot)
+
+    # should_shoot is bound per difficulty in __init__: weapons are used
+    # aggressively on hard, opportunistically on medium, never on easy.
+
+    @staticmethod
+    def _shoot_never(snapshot: GameSnapshot, ammo: int) -> bool:
+        return False
+
+    def _shoot_medium(self, snapshot: GameSnapshot, ammo: int) -> bool:
+        return ammo > 0 and self._aligned(snapshot) and self._rng.random() < 0.4
+
+    def _shoot_hard(self, snapshot: GameSnapshot, ammo: int) -> bool:
+        return ammo > 0 and self._aligned(snapshot)
+
+    @staticmethod
+    def _aligned(snapshot: GameSnapshot) -> bool:
+        return (
             snapshot.ai_position[0] == snapshot.opponent_position[0]
             or snapshot.ai_position[1] == snapshot.opponent_position[1]
         )
-        if self.difficulty == AIDifficulty.HARD:
-            return aligned
-        if self.difficulty == AIDifficulty.MEDIUM:
-            return aligned and random.random() < 0.4
-        return False
 
     def _easy(self, snapshot: GameSnapshot) -> Direction:
         safe = self._safe_directions(snapshot, look_ahead=1)
         if not safe:
             return snapshot.ai_direction
-        if snapshot.ai_direction in safe and random.random() < 0.65:
+        if snapshot.ai_direction in safe and self._rng.random() < 0.65:
             return snapshot.ai_direction
-        return random.choice(safe)
+        return self._rng.choice(safe)
 
     def _medium(self, snapshot: GameSnapshot) -> Direction:
-        options = self._safe_directions(snapshot, look_ahead=3)
+        options = self._safe_corridors(snapshot, look_ahead=3)
         if not options:
             return snapshot.ai_direction
-        scored = sorted(options, key=lambda d: self._space_score(snapshot, d, depth=4), reverse=True)
-        return scored[0]
+        scored = [
+            (self._space_score(snapshot, option, depth=4, corridor=corridor), option)
+            for option, corridor in options
+        ]
+        scored.sort(reverse=True)
+        return scored[0][1]
 
     def _hard(self, snapshot: GameSnapshot) -> Direction:
-        options = self._safe_directions(snapshot, look_ahead=4)
+        options = self._safe_corridors(snapshot, look_ahead=4)
         if not options:
             return snapshot.ai_direction
-        scored: list[tuple[float, Direction]] = []
-        for option in options:
-            space = self._space_score(snapshot, option, depth=6)
+        best_total: float | None = None
+        best_option = options[0][0]
+        for option, corridor in options:
             next_pos = add_direction(snapshot.ai_position, option)
             aggression = -self._manhattan(next_pos, snapshot.opponent_position) * 0.35
-            scored.append((space + aggression, option))
-        scored.sort(key=lambda item: item[0], reverse=True)
-        return scored[0][1]
+            # Once a best total is known, later options only need to be
+            # flood-filled far enough to prove whether they can beat it.
+            cutoff = None if best_total is None else int(best_total - aggression) + 1
+            space = self._space_score(snapshot, option, depth=6, cutoff=cutoff, corridor=corridor)
+            if cutoff is not None and space >= cutoff:
+                # The capped fill proved this option beats the incumbent but
+                # stopped at the cutoff, so its score is only a lower bound.
+                # Re-score at the full budget before adopting it as best, or
+                # later options would be compared against an understated bar.
+                space = self._space_score(snapshot, option, depth=6, corridor=corridor)
+            total = space + aggression
+            if best_total is None or total > best_total:
+                best_total = total
+                best_option = option
+        return best_option
 
     def _safe_directions(self, snapshot: GameSnapshot, look_ahead: int) -> list[Direction]:
-        safe: list[Direction] = []
-        for direction in DIRECTIONS:
-            if is_opposite(direction, snapshot.ai_direction):
-                continue
-            position = snapshot.ai_position
-            blocked = False
-            for _ in range(look_ahead):
-                position = add_direction(position, direction)
-                if position in snapshot.occupied or not in_bounds(position):
-                    blocked = True
+        return [direction for direction, _ in self._safe_corridors(snapshot, look_ahead)]
+
+    def _safe_corridors(
+        self, snapshot: GameSnapshot, look_ahead: int
+    ) -> list[tuple[Direction, list[int]]]:
+        """Return each safe direction with the packed cells of its corridor.
+
+        The corridor doubles as the flood-fill seed set, so the space score
+        never re-scans cells the safety walk already proved open.
+        """
+        grid = snapshot.grid
+        origin = pack_cell(*snapshot.ai_position)
+        safe: list[tuple[Direction, list[int]]] = []
+        for direction in ALLOWED_NEXT[snapshot.ai_direction]:
+            corridor: list[int] = []
+            for offset in LOOKAHEAD_OFFSETS[direction][:look_ahead]:
+                idx = origin + offset
+                if grid[idx]:
+                    corridor.clear()
                     break
-            if not blocked:
-                safe.append(direction)
+                corridor.append(idx)
+            if corridor:
+                safe.append((direction, corridor))
         return safe
 
-    def _space_score(self, snapshot: GameSnapshot, direction: Direction, depth: int) -> int:
-        start = add_direction(snapshot.ai_position, direction)
-        if not in_bounds(start) or start in snapshot.occupied:
-            return -9999
-        frontier = [start]
-        visited = {start}
-        score = 0
-        steps = 0
-        while frontier and steps < depth * 40:
-            current = frontier.pop(0)
-            score += 1
-            for candidate in DIRECTIONS:
-                nxt = add_direction(current, candidate)
-                if nxt in visited or nxt in snapshot.occupied or not in_bounds(nxt):
-                    continue
-                visited.add(nxt)
-                frontier.append(nxt)
-            steps += 1
-        return score
+    def _space_score(
+        self,
+        snapshot: GameSnapshot,
+        direction: Direction,
+        depth: int,
+        cutoff: int | None = None,
+        corridor: list[int] | None = None,
+    ) -> int:
+        grid = snapshot.grid
+        if corridor is None:
+            start = pack_cell(*snapshot.ai_position) + direction[1] * PAD_W + direction[0]
+            if grid[start]:
+                return -9999
+            corridor = [start]
+        budget = depth * 40
+        if cutoff is not None and cutoff < budget:
+            budget = max(cutoff, 1)
+        self._visited_gen += 1
+        return _flood_fill(grid, corridor, budget, self._visited_scratch, self._visited_gen)
 
     @staticmethod
     def _manhattan(a: Position, b: Position) -> int:
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 from pathlib import Path
-import pygame
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pygame
 
 
 class AudioManager:
@@ -13,10 +16,21 @@ class AudioManager:
         self.root = root
         self.sound_enabled = False
         self.sounds: dict[str, pygame.mixer.Sound] = {}
+        self._sound_list: list[pygame.mixer.Sound] = []
+        self._music_path: str | None = None
+
+        # pygame is imported lazily so AI-only sessions and headless test
+        # collection don't pay SDL's import cost just by touching this module.
         try:
-            pygame.mixer.init()
+            import pygame as _pygame
+        except ImportError:
+            self._pg = None
+            return
+        self._pg = _pygame
+        try:
+            _pygame.mixer.init()
             self.sound_enabled = True
-        except pygame.error:
+        except _pygame.error:
             self.sound_enabled = False
 
     def load_assets(self) -> None:
@@ -32,29 +46,34 @@ class AudioManager:
         for key, path in mapping.items():
             if path.exists():
                 try:
-                    self.sounds[key] = pygame.mixer.Sound(str(path))
-                except pygame.error:
+                    self.sounds[key] = self._pg.mixer.Sound(str(path))
+                except self._pg.error:
                     continue
 
+        self._sound_list = list(self.sounds.values())
+
+        # Resolve and stat the music file once so play_music stays free of
+        # path building and filesystem calls.
+        music_path = self.root / "assets" / "music" / "theme.ogg"
+        self._music_path = str(music_path) if music_path.exists() else None
+
     def set_volumes(self, master: float, music: float, sfx: float) -> None:
         """Apply current volume settings."""
         if not self.sound_enabled:
             return
-        pygame.mixer.music.set_volume(master * music)
-        for sound in self.sounds.values():
-            sound.set_volume(master * sfx)
+        self._pg.mixer.music.set_volume(master * music)
+        sfx_volume = master * sfx
+        for sound in self._sound_list:
+            sound.set_volume(sfx_volume)
 
     def play_music(self) -> None:
         """Play looping background music if file exists."""
-        if not self.sound_enabled:
-            return
-        music_path = self.root / "assets" / "music" / "theme.ogg"
-        if not music_path.exists():
+        if not self.sound_enabled or self._music_path is None:
             return
         try:
-            pygame.mixer.music.load(str(music_path))
-            pygame.mixer.music.play(-1)
-        except pygame.error:
+            self._pg.mixer.music.load(self._music_path)
+            self._pg.mixer.music.play(-1)
+        except self._pg.error:
             return
 
     def play(self, key: str) -> None:
@@ -0,0 +1,52 @@
+"""Optional Numba-compiled collision kernel, active with the accel extra."""
+
+from __future__ import annotations
+
+from .utils import SCREEN_HEIGHT, SCREEN_WIDTH
+
+try:  # pragma: no cover - exercised only with the optional accel extra
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+    njit = None
+
+if njit is not None:  # pragma: no cover
+
+    @njit(cache=True)
+    def _detect(next_xy, cur_xy, shields, occupied_packed, w, h):
+        dead = np.zeros(2, dtype=np.uint8)
+        head_on = next_xy[0, 0] == next_xy[1, 0] and next_xy[0, 1] == next_xy[1, 1]
+        swapped = (
+            next_xy[0, 0] == cur_xy[1, 0]
+            and next_xy[0, 1] == cur_xy[1, 1]
+            and next_xy[1, 0] == cur_xy[0, 0]
+            and next_xy[1, 1] == cur_xy[0, 1]
+        )
+        if head_on or swapped:
+            dead[0] = 1
+            dead[1] = 1
+        for i in range(2):
+            x = next_xy[i, 0]
+            y = next_xy[i, 1]
+            if x < 0 or x >= w or y < 0 or y >= h:
+                dead[i] = 1
+            elif shields[i] == 0 and occupied_packed.shape[0] > 0:
+                key = (np.uint64(x) << np.uint64(32)) | np.uint64(y)
+                lo = np.searchsorted(occupied_packed, key)
+                if lo < occupied_packed.shape[0] and occupied_packed[lo] == key:
+                    dead[i] = 1
+        return dead
+
+    def detect_dict(next_positions, occupied, shields, current_positions):
+        """Adapter matching game.detect_round_collision's dict interface."""
+        next_xy = np.array([next_positions[1], next_positions[2]], dtype=np.int64)
+        cur_xy = np.array([current_positions[1], current_positions[2]], dtype=np.int64)
+        shield_flags = np.array([shields[1], shields[2]], dtype=np.uint8)
+        cells = [(x << 32) | y for x, y in occupied]
+        packed = np.sort(np.array(cells, dtype=np.uint64)) if cells else np.empty(0, dtype=np.uint64)
+        dead = _detect(next_xy, cur_xy, shield_flags, packed, SCREEN_WIDTH, SCREEN_HEIGHT)
+        return {1: bool(dead[0]), 2: bool(dead[1])}
+
+else:
+    detect_dict = None
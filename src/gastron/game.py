@@ -6,16 +6,21 @@ from dataclasses import dataclass, field
 from enum import Enum, auto
 from pathlib import Path
 from typing import Iterable
+import concurrent.futures
+import heapq
 import time
+import numpy as np
 import pygame
 
+from . import collision_nb
 from .ai import GameSnapshot, TronAI
 from .audio import AudioManager
 from .menu import Menu, MenuItem
 from .particles import ParticleSystem
 from .player import LightCycle, Projectile, occupied_cells
-from .powerups import PowerUpManager
+from .powerups import PowerUp, PowerUpManager, PowerUpType
 from .settings import AIDifficulty, GameMode, GameSettings, SettingsManager
+from .spatial_hash import SpatialHashGrid
 from .utils import (
     BG_COLOR,
     CYAN,
@@ -42,6 +47,10 @@ from .utils import (
     save_json,
 )
 
+# Hard cap on retained replay rows (~8 minutes of ticks, ~600 KB); beyond
+# it the buffer wraps and the oldest frames are overwritten.
+REPLAY_CAP = 30000
+
 
 class GameState(Enum):
     """Finite states for menus and gameplay."""
@@ -66,15 +75,6 @@ class MatchInfo:
     round_start_time: float = field(default_factory=time.time)
 
 
-@dataclass(slots=True)
-class ReplayEvent:
-    """A single replay frame event."""
-
-    tick: int
-    p1: tuple[int, int]
-    p2: tuple[int, int]
-
-
 class TronGame:
     """Production-ready Tron game with menus, AI, effects, and persistence."""
 
@@ -83,6 +83,11 @@ class TronGame:
         pygame.font.init()
         ensure_data_dirs()
 
+        # Only quit and keydown are ever consumed; blocking the rest (mouse
+        # motion alone arrives at 100+ Hz) keeps the event queue tiny.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN])
+
         self.root = root
         self.settings_manager = SettingsManager()
         self.settings: GameSettings = self.settings_manager.settings
@@ -96,6 +101,12 @@ class TronGame:
         self.body_font = pygame.font.SysFont("consolas", 27, bold=True)
         self.small_font = pygame.font.SysFont("consolas", 18)
 
+        # Rendered-text cache: TTF shaping repeats identically frame after
+        # frame for HUD/settings/score strings, so reuse the surfaces.
+        self._text_cache: dict[tuple[int, str, tuple[int, int, int]], pygame.Surface] = {}
+        self._hud_title = self.title_font.render("GASTRON", True, YELLOW)
+        self._hud_title_shadow = self.title_font.render("GASTRON", True, SHADOW_COLOR)
+
         self.state = GameState.MAIN_MENU
         self.main_menu = Menu(
             title="GASTRON",
@@ -119,9 +130,25 @@ class TronGame:
         )
 
         self.players = self._create_players(self.settings)
-        self.player_group = pygame.sprite.Group(self.players)
-        self.projectiles = pygame.sprite.Group()
-        self.powerups = pygame.sprite.Group()
+        self._build_input_map()
+        # Rebuild guards: players and AI are only reconstructed when the
+        # relevant setting actually changed, not on every menu action.
+        self._last_built_mode = self.settings.game_mode
+        self._last_ai_difficulty = self.settings.ai_difficulty
+        # Bind the mode-specialized tick once so the per-tick mode branch
+        # disappears from the hot path.
+        self._simulate_step = (
+            self._simulate_step_sp
+            if self.settings.game_mode == GameMode.SINGLE_PLAYER
+            else self._simulate_step_mp
+        )
+        # Projectiles live in a plain list: a handful of entities managed
+        # with swap-pop removal, without Group membership bookkeeping.
+        self.projectiles: list[Projectile] = []
+        # Powerups are grid-snapped, so pickup is an exact-cell dict lookup
+        # keyed by position rather than a rect sweep.
+        self.powerups: list[PowerUp] = []
+        self._powerup_by_cell: dict[tuple[int, int], PowerUp] = {}
         self.powerup_manager = PowerUpManager()
         self.particles = ParticleSystem()
 
@@ -142,12 +169,59 @@ class TronGame:
         self.flash_timer = 0
 
         self.tick_accumulator_ms = 0.0
+        self._speed_active = False
         self.grid_offset = [0.0, 0.0]
         self.screen_shake_frames = 0
         self.screen_shake_magnitude = 0
 
         self.simulation_tick = 0
-        self.replay_log: list[ReplayEvent] = []
+        # Replay frames live in a flat int32 buffer of (tick, p1x, p1y,
+        # p2x, p2y) rows; one row is 20 bytes versus a per-tick Python
+        # object, and serialization is a single tolist() call. The buffer
+        # doubles up to REPLAY_CAP rows, then wraps, so a marathon round
+        # keeps only its most recent frames and memory stays bounded.
+        self.replay_log = np.empty((4096, 5), dtype=np.int32)
+        self._replay_len = 0
+
+        # Single-worker pool keeps save writes ordered while moving JSON
+        # encoding and disk I/O off the render thread at match end.
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+        # Repaint gate: set on input and simulation steps; a forced repaint
+        # every ~33 ms keeps parallax and particles animating between them.
+        self._dirty = True
+
+        # Incrementally maintained union of trail cells and heads, replacing
+        # the per-tick occupied_cells scans over both trails.
+        self.occupied: set[tuple[int, int]] = set()
+
+        # Broad-phase index of trail cells so projectile tests only touch
+        # the bucket around the projectile. The payload is a bitmask of the
+        # owning player ids (1 and 2): a shielded player crossing the
+        # opponent's trail puts the same cell in both trails.
+        self.trail_grid = SpatialHashGrid()
+
+        self._grid_surface = self._build_grid_surface()
+
+        # Glow sprites are composited once per (color, geometry, alpha) and
+        # blitted thereafter; building them per cell hammered the allocator.
+        self._glow_cache: dict[tuple, pygame.Surface] = {}
+        self._powerup_glow = pygame.Surface((GRID_SIZE * 3, GRID_SIZE * 3), pygame.SRCALPHA)
+        pygame.draw.circle(self._powerup_glow, (*GREEN, 60), (GRID_SIZE + 5, GRID_SIZE + 5), GRID_SIZE)
+
+        # Per-color trail tiles at 16 quantized fade alphas, submitted in one
+        # blits batch per player instead of per-cell draw calls.
+        self._trail_tiles: dict[tuple[int, int, int], tuple[list[pygame.Surface], list[pygame.Surface]]] = {}
+
+        # Full-screen compositing surfaces allocated once and zero-filled
+        # per frame; the two dim overlays never change, so they are filled
+        # here and only blitted thereafter.
+        self._frame_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self._glow_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self._pause_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self._pause_overlay.fill((0, 0, 0, 135))
+        self._round_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self._round_overlay.fill((4, 8, 16, 165))
 
     @staticmethod
     def _create_players(settings: GameSettings) -> tuple[LightCycle, LightCycle]:
@@ -191,10 +265,14 @@ class TronGame:
         """Reset round entities but preserve match score state."""
         for player in self.players:
             player.reset_round()
-        self.projectiles.empty()
-        self.powerups.empty()
-        self.replay_log.clear()
+        self.projectiles.clear()
+        self.powerups.clear()
+        self._powerup_by_cell.clear()
+        self.occupied.clear()
+        self.trail_grid.clear()
+        self._replay_len = 0
         self.tick_accumulator_ms = 0
+        self._speed_active = False
         self.match.round_start_time = time.time()
         self.winner = None
         self.round_stats = None
@@ -210,6 +288,7 @@ class TronGame:
     def run(self) -> None:
         """Main event/render/update loop."""
         running = True
+        last_render_ticks = 0
         while running:
             dt_ms = self.clock.tick(FPS)
             running = self._handle_events()
@@ -221,16 +300,20 @@ class TronGame:
             elif self.state == GameState.ROUND_OVER:
                 self.particles.update()
 
-            self._render()
+            now = pygame.time.get_ticks()
+            if self._dirty or now - last_render_ticks >= 33:
+                self._render()
+                last_render_ticks = now
+                self._dirty = False
 
+        self._io_pool.shutdown(wait=True)
         pygame.quit()
 
     def _handle_events(self) -> bool:
-        for event in pygame.event.get():
+        for event in pygame.event.get((pygame.QUIT, pygame.KEYDOWN)):
             if event.type == pygame.QUIT:
                 return False
-            if event.type != pygame.KEYDOWN:
-                continue
+            self._dirty = True
 
             if event.key == pygame.K_ESCAPE:
                 if self.state == GameState.PLAYING:
@@ -329,7 +412,9 @@ class TronGame:
             self.state = GameState.MAIN_MENU
 
         self.settings = self.settings_manager.settings
-        self.ai = TronAI(self.settings.ai_difficulty)
+        if self.settings.ai_difficulty != self._last_ai_difficulty:
+            self.ai = TronAI(self.settings.ai_difficulty)
+            self._last_ai_difficulty = self.settings.ai_difficulty
         self.audio.set_volumes(
             self.settings.master_volume,
             self.settings.music_volume,
@@ -338,27 +423,52 @@ class TronGame:
 
     def _refresh_mode(self) -> None:
         self.settings = self.settings_manager.settings
-        self.players = self._create_players(self.settings)
-        self.player_group = pygame.sprite.Group(self.players)
-        self.ai = TronAI(self.settings.ai_difficulty)
+        if (
+            self.settings.game_mode == self._last_built_mode
+            and self.settings.ai_difficulty == self._last_ai_difficulty
+        ):
+            return
+        if self.settings.game_mode != self._last_built_mode:
+            self.players = self._create_players(self.settings)
+            self._build_input_map()
+            self._simulate_step = (
+                self._simulate_step_sp
+                if self.settings.game_mode == GameMode.SINGLE_PLAYER
+                else self._simulate_step_mp
+            )
+            self._last_built_mode = self.settings.game_mode
+        if self.settings.ai_difficulty != self._last_ai_difficulty:
+            self.ai = TronAI(self.settings.ai_difficulty)
+            self._last_ai_difficulty = self.settings.ai_difficulty
+
+    def _build_input_map(self) -> None:
+        """Flatten both players' bindings into single-lookup dispatch maps."""
+        self._key_to_player_dir = {
+            key: (player, direction)
+            for player in self.players
+            for key, direction in player.controls.items()
+        }
+        self._shoot_key_to_player = {player.shoot_key: player for player in self.players}
 
     def _handle_gameplay_input(self, key: int) -> None:
-        for player in self.players:
-            player.queue_turn(key)
-            if key == player.shoot_key and player.ammo > 0:
-                player.ammo -= 1
-                self.projectiles.add(Projectile(player.player_id, player.position, player.direction))
-                self.audio.play("shoot")
+        hit = self._key_to_player_dir.get(key)
+        if hit is not None:
+            hit[0].queue_direction(hit[1])
+            return
+        shooter = self._shoot_key_to_player.get(key)
+        if shooter is not None and shooter.ammo > 0:
+            shooter.ammo -= 1
+            self.projectiles.append(Projectile(shooter.player_id, shooter.position, shooter.direction))
+            self.audio.play("shoot")
 
     def _update_playing(self, dt_ms: float) -> None:
         self.tick_accumulator_ms += dt_ms
-        step_ms = DEFAULT_STEP_INTERVAL_MS
-        if any(player.power_state.speed_timer > 0 for player in self.players):
-            step_ms = int(DEFAULT_STEP_INTERVAL_MS * 0.75)
+        step_ms = int(DEFAULT_STEP_INTERVAL_MS * 0.75) if self._speed_active else DEFAULT_STEP_INTERVAL_MS
 
         while self.tick_accumulator_ms >= step_ms:
             self.tick_accumulator_ms -= step_ms
             self._simulate_step()
+            self._dirty = True
             if self.state != GameState.PLAYING:
                 break
 
@@ -366,37 +476,67 @@ class TronGame:
         if self.flash_timer > 0:
             self.flash_timer -= 1
 
-    def _simulate_step(self) -> None:
+    def _simulate_step_sp(self) -> None:
+        """Single-player tick: AI decision, then the shared step body."""
         p1, p2 = self.players
+        self.occupied.add(p1.position)
+        self.occupied.add(p2.position)
+        snapshot = GameSnapshot(
+            ai_position=p2.position,
+            ai_direction=p2.direction,
+            opponent_position=p1.position,
+            occupied=self.occupied,
+        )
+        p2.pending_direction = self.ai.choose_direction(snapshot)
+        if self.ai.should_shoot(snapshot, p2.ammo):
+            p2.ammo -= 1
+            self.projectiles.append(Projectile(p2.player_id, p2.position, p2.direction))
+        self._simulate_step_mp()
 
-        if self.settings.game_mode == GameMode.SINGLE_PLAYER:
-            snapshot = GameSnapshot(
-                ai_position=p2.position,
-                ai_direction=p2.direction,
-                opponent_position=p1.position,
-                occupied=occupied_cells(self.players),
-            )
-            p2.pending_direction = self.ai.choose_direction(snapshot)
-            if self.ai.should_shoot(snapshot, p2.ammo):
-                p2.ammo -= 1
-                self.projectiles.add(Projectile(p2.player_id, p2.position, p2.direction))
+    def _simulate_step_mp(self) -> None:
+        p1, p2 = self.players
+
+        # Heads are occupied from this tick on; they become trail cells once
+        # the players move below.
+        self.occupied.add(p1.position)
+        self.occupied.add(p2.position)
 
         for player in self.players:
             player.apply_pending_turn()
 
-        for projectile in list(self.projectiles):
+        projectiles = self.projectiles
+        i = 0
+        while i < len(projectiles):
+            projectile = projectiles[i]
             projectile.step()
-            if not in_bounds(projectile.position):
-                projectile.kill()
+            px, py = projectile.position
+            if (px | py | (SCREEN_WIDTH - 1 - px) | (SCREEN_HEIGHT - 1 - py)) < 0:
+                projectiles[i] = projectiles[-1]
+                projectiles.pop()
                 continue
             victim = p2 if projectile.owner_id == 1 else p1
-            if projectile.position in victim.trail_set:
-                victim.trail_set.discard(projectile.position)
-                victim.trail = [pos for pos in victim.trail if pos != projectile.position]
-                projectile.kill()
+            pos = projectile.position
+            owners = self.trail_grid.candidates(pos).get(pos, 0)
+            if owners & victim.player_id:
+                del victim.trail[pos]
+                remaining = owners ^ victim.player_id
+                if remaining:
+                    # A shielded crossing leaves the cell in both trails;
+                    # it stays occupied under the other owner.
+                    self.trail_grid.insert(pos, remaining)
+                else:
+                    self.trail_grid.remove(pos)
+                    if pos != p1.position and pos != p2.position:
+                        self.occupied.discard(pos)
+                projectiles[i] = projectiles[-1]
+                projectiles.pop()
+                continue
+            i += 1
 
-        occupied = occupied_cells(self.players)
-        self.powerup_manager.maybe_spawn(self.powerups, occupied)
+        occupied = self.occupied
+        spawned = self.powerup_manager.maybe_spawn(self.powerups, occupied)
+        if spawned is not None:
+            self._powerup_by_cell[spawned.position] = spawned
 
         for player in self.players:
             player.tick_effects()
@@ -415,7 +555,8 @@ class TronGame:
 
         for player in self.players:
             nxt = next_positions[player.player_id]
-            if not in_bounds(nxt):
+            nx, ny = nxt
+            if (nx | ny | (SCREEN_WIDTH - 1 - nx) | (SCREEN_HEIGHT - 1 - ny)) < 0:
                 dead[player.player_id] = True
                 continue
             if nxt in occupied and not player.has_shield:
@@ -425,25 +566,56 @@ class TronGame:
             if dead[player.player_id]:
                 continue
             previous = player.position
-            player.trail.append(previous)
-            player.trail_set.add(previous)
+            player.trail[previous] = None
+            owners = self.trail_grid.candidates(previous).get(previous, 0)
+            self.trail_grid.insert(previous, owners | player.player_id)
             player.position = next_positions[player.player_id]
             player.update_sprite()
             self.particles.emit_trail_spark(player.position, player.color)
 
-            hit = pygame.sprite.spritecollideany(player, self.powerups)
-            if hit and isinstance(hit, pygame.sprite.Sprite):
+            hit = self._powerup_by_cell.pop(player.position, None)
+            if hit is not None:
+                self.powerups.remove(hit)
                 self.audio.play("powerup")
                 self.flash_message = self.powerup_manager.apply(player, hit.kind)
                 self.flash_timer = FPS * 2
-                hit.kill()
-
-        self.replay_log.append(ReplayEvent(self.simulation_tick, p1.position, p2.position))
+                if hit.kind == PowerUpType.ERASER:
+                    # Erasure frees trail cells; rebuild on this rare event
+                    # instead of threading removals through the manager.
+                    self._rebuild_occupancy()
+
+        # Speed state only changes on simulation ticks (timer decay and
+        # pickups above), so the per-frame step interval reads this flag.
+        self._speed_active = p1.power_state.speed_timer > 0 or p2.power_state.speed_timer > 0
+
+        buf = self.replay_log
+        size = len(buf)
+        if self._replay_len == size and size < REPLAY_CAP:
+            grown = np.empty((min(size * 2, REPLAY_CAP), 5), dtype=np.int32)
+            grown[:size] = buf
+            self.replay_log = buf = grown
+        buf[self._replay_len % REPLAY_CAP] = (
+            self.simulation_tick,
+            p1.position[0],
+            p1.position[1],
+            p2.position[0],
+            p2.position[1],
+        )
+        self._replay_len += 1
         self.simulation_tick += 1
 
         if dead[1] or dead[2]:
             self._finish_round(dead[1], dead[2])
 
+    def _rebuild_occupancy(self) -> None:
+        """Resync the incremental occupancy structures from the trails."""
+        self.occupied = occupied_cells(self.players)
+        self.trail_grid.clear()
+        for player in self.players:
+            for cell in player.trail:
+                owners = self.trail_grid.candidates(cell).get(cell, 0)
+                self.trail_grid.insert(cell, owners | player.player_id)
+
     def _finish_round(self, p1_dead: bool, p2_dead: bool) -> None:
         p1, p2 = self.players
         self.state = GameState.ROUND_OVER
@@ -513,8 +685,15 @@ class TronGame:
             "timestamp": int(time.time()),
         }
         scores.append(entry)
-        scores.sort(key=lambda row: (row["p1_score"], row["p2_score"], -row["duration_seconds"]), reverse=True)
-        save_json(SCORES_FILE, scores[:20])
+        top = heapq.nlargest(20, scores, key=lambda row: (row["p1_score"], row["p2_score"], -row["duration_seconds"]))
+        self._io_pool.submit(save_json, SCORES_FILE, top)
+
+    def _replay_rows(self) -> list[list[int]]:
+        """Return recorded replay rows oldest-first, unwrapping the ring."""
+        if self._replay_len <= len(self.replay_log):
+            return self.replay_log[: self._replay_len].tolist()
+        start = self._replay_len % REPLAY_CAP
+        return np.concatenate((self.replay_log[start:], self.replay_log[:start])).tolist()
 
     def _save_replay(self) -> None:
         from .utils import REPLAY_DIR, save_json
@@ -522,9 +701,12 @@ class TronGame:
         replay_path = REPLAY_DIR / f"match_{int(time.time())}.json"
         payload = {
             "mode": self.settings.game_mode.value,
-            "events": [{"tick": ev.tick, "p1": ev.p1, "p2": ev.p2} for ev in self.replay_log],
+            "events": [
+                {"tick": tick, "p1": [p1x, p1y], "p2": [p2x, p2y]}
+                for tick, p1x, p1y, p2x, p2y in self._replay_rows()
+            ],
         }
-        save_json(replay_path, payload)
+        self._io_pool.submit(save_json, replay_path, payload)
 
     def _render(self) -> None:
         shake_x = shake_y = 0
@@ -533,14 +715,13 @@ class TronGame:
             shake_x = int(pygame.time.get_ticks() % self.screen_shake_magnitude) - self.screen_shake_magnitude // 2
             shake_y = int((pygame.time.get_ticks() // 2) % self.screen_shake_magnitude) - self.screen_shake_magnitude // 2
 
-        frame = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        frame = self._frame_surf
+        frame.fill((0, 0, 0, 0))
         if self.state == GameState.MAIN_MENU:
             self.main_menu.render(frame, self.title_font, self.body_font)
         elif self.state == GameState.PAUSED:
             self._render_playfield(frame)
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 135))
-            frame.blit(overlay, (0, 0))
+            frame.blit(self._pause_overlay, (0, 0))
             self.pause_menu.render(frame, self.title_font, self.body_font)
         elif self.state == GameState.SETTINGS:
             self._render_settings(frame)
@@ -560,48 +741,87 @@ class TronGame:
         if self.settings.display.show_grid:
             self._draw_parallax_grid(surface)
 
-        glow_layer = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        glow_layer = self._glow_surf
+        glow_layer.fill((0, 0, 0, 0))
 
         for player in self.players:
             self._draw_trail(glow_layer, player)
             self._draw_head(glow_layer, player)
 
         for powerup in self.powerups:
-            glow = pygame.Surface((GRID_SIZE * 3, GRID_SIZE * 3), pygame.SRCALPHA)
-            pygame.draw.circle(glow, (*GREEN, 60), (GRID_SIZE + 5, GRID_SIZE + 5), GRID_SIZE)
-            glow_layer.blit(glow, (powerup.rect.x - GRID_SIZE, powerup.rect.y - GRID_SIZE))
+            glow_layer.blit(self._powerup_glow, (powerup.rect.x - GRID_SIZE, powerup.rect.y - GRID_SIZE))
 
         surface.blit(glow_layer, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
-        self.powerups.draw(surface)
-        self.projectiles.draw(surface)
+        surface.blits([(p.image, p.rect) for p in self.powerups], doreturn=0)
+        surface.blits([(p.image, p.rect) for p in self.projectiles], doreturn=0)
         self.particles.draw(surface)
         self._render_hud(surface)
 
-    def _draw_parallax_grid(self, surface: pygame.Surface) -> None:
-        self.grid_offset[0] = (self.grid_offset[0] + 0.3) % (GRID_SIZE * 2)
-        self.grid_offset[1] = (self.grid_offset[1] + 0.15) % (GRID_SIZE * 2)
-        ox = int(self.grid_offset[0])
-        oy = int(self.grid_offset[1])
-
-        for x in range(-GRID_SIZE * 2, SCREEN_WIDTH + GRID_SIZE * 2, GRID_SIZE * 2):
+    @staticmethod
+    def _build_grid_surface() -> pygame.Surface:
+        """Pre-render the parallax grid lines once into an oversized tile.
+
+        Per frame the tile is blitted at the scroll offset, replacing a few
+        hundred alpha-blended line primitives with a single copy.
+        """
+        margin = GRID_SIZE * 2
+        baked = pygame.Surface((SCREEN_WIDTH + margin * 2, SCREEN_HEIGHT + margin * 2), pygame.SRCALPHA)
+        for x in range(-margin, SCREEN_WIDTH + margin, GRID_SIZE * 2):
             strong = ((x // (GRID_SIZE * 2)) % 6) == 0
             color = GRID_GLOW if strong else GRID_COLOR
             alpha = 85 if strong else 45
-            pygame.draw.line(surface, (*color, alpha), (x - ox, 0), (x - ox, SCREEN_HEIGHT), 1)
-        for y in range(-GRID_SIZE * 2, SCREEN_HEIGHT + GRID_SIZE * 2, GRID_SIZE * 2):
+            pygame.draw.line(baked, (*color, alpha), (x + margin, 0), (x + margin, baked.get_height()), 1)
+        for y in range(-margin, SCREEN_HEIGHT + margin, GRID_SIZE * 2):
             strong = ((y // (GRID_SIZE * 2)) % 6) == 0
             color = GRID_GLOW if strong else GRID_COLOR
             alpha = 85 if strong else 45
-            pygame.draw.line(surface, (*color, alpha), (0, y - oy), (SCREEN_WIDTH, y - oy), 1)
+            pygame.draw.line(baked, (*color, alpha), (0, y + margin), (baked.get_width(), y + margin), 1)
+        return baked
+
+    def _draw_parallax_grid(self, surface: pygame.Surface) -> None:
+        self.grid_offset[0] = (self.grid_offset[0] + 0.3) % (GRID_SIZE * 2)
+        self.grid_offset[1] = (self.grid_offset[1] + 0.15) % (GRID_SIZE * 2)
+        margin = GRID_SIZE * 2
+        surface.blit(
+            self._grid_surface,
+            (-margin - int(self.grid_offset[0]), -margin - int(self.grid_offset[1])),
+        )
+
+    def _trail_tile_atlas(
+        self, color: tuple[int, int, int], glow_color: tuple[int, int, int]
+    ) -> tuple[list[pygame.Surface], list[pygame.Surface]]:
+        """Return (body, glow) tiles for 16 quantized fade-alpha buckets."""
+        atlas = self._trail_tiles.get(color)
+        if atlas is None:
+            body_tiles: list[pygame.Surface] = []
+            glow_tiles: list[pygame.Surface] = []
+            for bucket in range(16):
+                alpha = bucket * 14 + 7
+                tile = pygame.Surface((GRID_SIZE, GRID_SIZE), pygame.SRCALPHA)
+                pygame.draw.rect(tile, (*color, alpha), tile.get_rect(), border_radius=2)
+                body_tiles.append(tile)
+                glow_tiles.append(
+                    self._glow_sprite(glow_color, (GRID_SIZE, GRID_SIZE), 3, 8, max(25, alpha // 2))
+                )
+            atlas = (body_tiles, glow_tiles)
+            self._trail_tiles[color] = atlas
+        return atlas
 
     def _draw_trail(self, surface: pygame.Surface, player: LightCycle) -> None:
         trail = player.trail
         total = max(1, len(trail))
+        body_tiles, glow_tiles = self._trail_tile_atlas(player.color, player.glow_color)
+        fade = self.settings.display.trail_fade
+        glow_offset = 3 * 8 // 2
+        glow_blits: list[tuple[pygame.Surface, tuple[int, int]]] = []
+        body_blits: list[tuple[pygame.Surface, tuple[int, int]]] = []
         for idx, cell in enumerate(trail):
-            fade_alpha = int(50 + 180 * ((idx + 1) / total)) if self.settings.display.trail_fade else 220
-            rect = pygame.Rect(cell[0], cell[1], GRID_SIZE, GRID_SIZE)
-            self._draw_glow_rect(surface, player.glow_color, rect, 3, 8, max(25, fade_alpha // 2))
-            pygame.draw.rect(surface, (*player.color, fade_alpha), rect, border_radius=2)
+            fade_alpha = int(50 + 180 * ((idx + 1) / total)) if fade else 220
+            bucket = min(15, fade_alpha // 14)
+            glow_blits.append((glow_tiles[bucket], (cell[0] - glow_offset, cell[1] - glow_offset)))
+            body_blits.append((body_tiles[bucket], cell))
+        surface.blits(glow_blits, doreturn=0)
+        surface.blits(body_blits, doreturn=0)
 
     def _draw_head(self, surface: pygame.Surface, player: LightCycle) -> None:
         rect = pygame.Rect(player.position[0], player.position[1], GRID_SIZE, GRID_SIZE)
@@ -609,8 +829,30 @@ class TronGame:
         self._draw_glow_rect(surface, color, rect, 4, 10, 170)
         pygame.draw.rect(surface, (*color, 255), rect, border_radius=3)
 
-    @staticmethod
+    def _glow_sprite(
+        self,
+        color: tuple[int, int, int],
+        size: tuple[int, int],
+        layers: int,
+        spread: int,
+        alpha: int,
+    ) -> pygame.Surface:
+        """Return a cached composite of the stacked glow layers."""
+        key = (color, size, layers, spread, alpha)
+        glow = self._glow_cache.get(key)
+        if glow is None:
+            full = layers * spread
+            glow = pygame.Surface((size[0] + full, size[1] + full), pygame.SRCALPHA)
+            for i in range(layers, 0, -1):
+                inflate = i * spread
+                layer = pygame.Surface((size[0] + inflate, size[1] + inflate), pygame.SRCALPHA)
+                pygame.draw.rect(layer, (*color, max(8, alpha // (i + 1))), layer.get_rect(), border_radius=4)
+                glow.blit(layer, ((full - inflate) // 2, (full - inflate) // 2))
+            self._glow_cache[key] = glow
+        return glow
+
     def _draw_glow_rect(
+        self,
         surface: pygame.Surface,
         color: tuple[int, int, int],
         rect: pygame.Rect,
@@ -618,18 +860,24 @@ class TronGame:
         spread: int,
         alpha: int,
     ) -> None:
-        for i in range(layers, 0, -1):
-            inflate = i * spread
-            glow_rect = rect.inflate(inflate, inflate)
-            glow = pygame.Surface(glow_rect.size, pygame.SRCALPHA)
-            pygame.draw.rect(glow, (*color, max(8, alpha // (i + 1))), glow.get_rect(), border_radius=4)
-            surface.blit(glow, glow_rect.topleft)
+        glow = self._glow_sprite(color, rect.size, layers, spread, alpha)
+        offset = layers * spread // 2
+        surface.blit(glow, (rect.x - offset, rect.y - offset))
+
+    def _text(self, font: pygame.font.Font, text: str, color: tuple[int, int, int]) -> pygame.Surface:
+        """Return a cached rendered surface for (font, text, color)."""
+        key = (id(font), text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            if len(self._text_cache) > 512:
+                self._text_cache.clear()
+            surface = font.render(text, True, color)
+            self._text_cache[key] = surface
+        return surface
 
     def _render_hud(self, surface: pygame.Surface) -> None:
-        title = self.title_font.render("GASTRON", True, YELLOW)
-        title_shadow = self.title_font.render("GASTRON", True, SHADOW_COLOR)
-        surface.blit(title_shadow, (24, 19))
-        surface.blit(title, (20, 15))
+        surface.blit(self._hud_title_shadow, (24, 19))
+        surface.blit(self._hud_title, (20, 15))
 
         p1, p2 = self.players
         lines = [
@@ -639,20 +887,18 @@ class TronGame:
             (f"AI: {self.settings.ai_difficulty.value.title()}", ORANGE),
         ]
         for idx, (line, color) in enumerate(lines):
-            text = self.small_font.render(line, True, color)
+            text = self._text(self.small_font, line, color)
             surface.blit(text, (20, 82 + idx * 22))
 
-        helper = self.small_font.render("ESC Pause | Space Continue | Shoot: RightCtrl / LeftShift", True, TEXT_COLOR)
+        helper = self._text(self.small_font, "ESC Pause | Space Continue | Shoot: RightCtrl / LeftShift", TEXT_COLOR)
         surface.blit(helper, (20, SCREEN_HEIGHT - 28))
 
         if self.flash_timer > 0 and self.flash_message:
-            msg = self.body_font.render(self.flash_message, True, GREEN)
+            msg = self._text(self.body_font, self.flash_message, GREEN)
             surface.blit(msg, (SCREEN_WIDTH // 2 - msg.get_width() // 2, 20))
 
     def _render_round_overlay(self, surface: pygame.Surface) -> None:
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((4, 8, 16, 165))
-        surface.blit(overlay, (0, 0))
+        surface.blit(self._round_overlay, (0, 0))
 
         if not self.round_stats:
             return
@@ -662,14 +908,14 @@ class TronGame:
         else:
             headline = self.round_stats.winner_name.upper() + " WINS" if self.round_stats.winner_name else "DOUBLE CRASH"
 
-        line1 = self.title_font.render(headline, True, YELLOW)
-        line2 = self.body_font.render(self.round_stats.crash_type, True, TEXT_COLOR)
-        line3 = self.small_font.render(
+        line1 = self._text(self.title_font, headline, YELLOW)
+        line2 = self._text(self.body_font, self.round_stats.crash_type, TEXT_COLOR)
+        line3 = self._text(
+            self.small_font,
             f"Round time: {self.round_stats.duration_seconds:.1f}s | Trails P1/P2: {self.round_stats.p1_cells}/{self.round_stats.p2_cells}",
-            True,
             ORANGE,
         )
-        prompt = self.small_font.render("Press Space/Enter", True, TEXT_COLOR)
+        prompt = self._text(self.small_font, "Press Space/Enter", TEXT_COLOR)
 
         surface.blit(line1, (SCREEN_WIDTH // 2 - line1.get_width() // 2, SCREEN_HEIGHT // 2 - 110))
         surface.blit(line2, (SCREEN_WIDTH // 2 - line2.get_width() // 2, SCREEN_HEIGHT // 2 - 50))
@@ -678,7 +924,7 @@ class TronGame:
 
     def _render_settings(self, surface: pygame.Surface) -> None:
         surface.fill(BG_COLOR)
-        title = self.title_font.render("SETTINGS", True, YELLOW)
+        title = self._text(self.title_font, "SETTINGS", YELLOW)
         surface.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 56))
 
         lines = [
@@ -692,23 +938,23 @@ class TronGame:
             "Back: ESC or Backspace",
         ]
         for idx, line in enumerate(lines):
-            text = self.body_font.render(line, True, TEXT_COLOR)
+            text = self._text(self.body_font, line, TEXT_COLOR)
             surface.blit(text, (120, 180 + idx * 45))
 
     def _render_scores(self, surface: pygame.Surface) -> None:
         surface.fill(BG_COLOR)
-        title = self.title_font.render("HIGH SCORES", True, YELLOW)
+        title = self._text(self.title_font, "HIGH SCORES", YELLOW)
         surface.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 56))
 
         scores = load_json(SCORES_FILE, [])
-        headers = self.small_font.render("Name | Mode | Rounds | P1 | P2 | Duration(s)", True, ORANGE)
+        headers = self._text(self.small_font, "Name | Mode | Rounds | P1 | P2 | Duration(s)", ORANGE)
         surface.blit(headers, (120, 140))
         for idx, entry in enumerate(scores[:12]):
             line = f"{entry['name']:<10} {entry['mode']:<11} {entry['rounds']:<6} {entry['p1_score']:<3} {entry['p2_score']:<3} {entry['duration_seconds']:<7}"
-            text = self.small_font.render(line, True, TEXT_COLOR)
+            text = self._text(self.small_font, line, TEXT_COLOR)
             surface.blit(text, (120, 175 + idx * 30))
 
-        prompt = self.small_font.render("Backspace / ESC to return", True, TEXT_COLOR)
+        prompt = self._text(self.small_font, "Backspace / ESC to return", TEXT_COLOR)
         surface.blit(prompt, (120, SCREEN_HEIGHT - 40))
 
 
@@ -719,6 +965,9 @@ def detect_round_collision(
     current_positions: dict[int, tuple[int, int]],
 ) -> dict[int, bool]:
     """Pure helper used by tests to validate collision behavior."""
+    if collision_nb.detect_dict is not None:
+        return collision_nb.detect_dict(next_positions, occupied, shields, current_positions)
+
     occupied_set = set(occupied)
     dead = {1: False, 2: False}
 
@@ -51,8 +51,9 @@ class LightCycle(pygame.sprite.Sprite):
     position: Position = field(init=False)
     direction: Direction = field(init=False)
     pending_direction: Direction | None = field(default=None, init=False)
-    trail: list[Position] = field(default_factory=list, init=False)
-    trail_set: set[Position] = field(default_factory=set, init=False)
+    # Insertion-ordered dict doubles as the membership set and supports O(1)
+    # removal of arbitrary cells when projectiles punch holes in the trail.
+    trail: Dict[Position, None] = field(default_factory=dict, init=False)
     alive: bool = field(default=True, init=False)
     score: int = field(default=0, init=False)
     ammo: int = field(default=0, init=False)
@@ -73,7 +74,6 @@ class LightCycle(pygame.sprite.Sprite):
         self.direction = self.start_dir
         self.pending_direction = None
         self.trail.clear()
-        self.trail_set.clear()
         self.alive = True
         self.ammo = 0
         self.power_state = PowerState()
@@ -81,9 +81,12 @@ class LightCycle(pygame.sprite.Sprite):
 
     def queue_turn(self, key: int) -> None:
         """Queue the next direction if the input is legal."""
-        if key not in self.controls:
-            return
-        candidate = self.controls[key]
+        candidate = self.controls.get(key)
+        if candidate is not None:
+            self.queue_direction(candidate)
+
+    def queue_direction(self, candidate: Direction) -> None:
+        """Queue a pre-resolved direction change if the turn is legal."""
         if candidate == self.direction or is_opposite(candidate, self.direction):
             return
         self.pending_direction = candidate
@@ -101,11 +104,10 @@ class LightCycle(pygame.sprite.Sprite):
         return add_direction(self.position, self.direction)
 
     def consume_trail_segment(self, max_count: int = 20) -> None:
-        """Erase a section of this player's own trail."""
+        """Erase the oldest section of this player's own trail."""
         remove_count = min(max_count, len(self.trail))
         for _ in range(remove_count):
-            removed = self.trail.pop(0)
-            self.trail_set.discard(removed)
+            del self.trail[next(iter(self.trail))]
 
     def tick_effects(self) -> None:
         """Advance effect timers by one simulation step."""
@@ -130,5 +132,5 @@ def occupied_cells(players: Iterable[LightCycle]) -> set[Position]:
     cells: set[Position] = set()
     for player in players:
         cells.add(player.position)
-        cells.update(player.trail_set)
+        cells.update(player.trail)
     return cells
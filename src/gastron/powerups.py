@@ -48,17 +48,19 @@ class PowerUpManager:
     max_powerups: int = 3
     ticks_since_spawn: int = 0
 
-    def maybe_spawn(self, group: pygame.sprite.Group, occupied: set[Position]) -> None:
-        """Spawn a power-up when the cooldown expires."""
+    def maybe_spawn(self, powerups: list[PowerUp], occupied: set[Position]) -> PowerUp | None:
+        """Spawn a power-up when the cooldown expires; return it if created."""
         self.ticks_since_spawn += 1
         if self.ticks_since_spawn < self.spawn_interval_ticks:
-            return
+            return None
         self.ticks_since_spawn = 0
-        if len(group.sprites()) >= self.max_powerups:
-            return
+        if len(powerups) >= self.max_powerups:
+            return None
         kind = random.choice(list(PowerUpType))
         position = random_open_cell(occupied)
-        group.add(PowerUp(kind=kind, position=position))
+        powerup = PowerUp(kind=kind, position=position)
+        powerups.append(powerup)
+        return powerup
 
     def apply(self, player: LightCycle, kind: PowerUpType) -> str:
         """Apply the effects of a picked-up power-up."""
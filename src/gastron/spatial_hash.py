@@ -0,0 +1,52 @@
+"""Spatial hash broad-phase for grid-aligned entities."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+
+from .utils import GRID_SIZE, Position
+
+# Bucket span in pixels; each bucket covers an 8x8 block of trail cells.
+CELL_SPAN = GRID_SIZE * 8
+
+# Large primes keep coarse coordinates well mixed in a single int key.
+_PRIME_X = 73856093
+_PRIME_Y = 19349663
+
+_EMPTY: dict[Position, int] = {}
+
+
+class SpatialHashGrid:
+    """Buckets grid-aligned cells so queries only touch local candidates.
+
+    Bucket dicts are reused across frames: clearing empties them but keeps
+    the allocations, avoiding per-round churn.
+    """
+
+    __slots__ = ("_buckets",)
+
+    def __init__(self) -> None:
+        self._buckets: dict[int, dict[Position, int]] = defaultdict(dict)
+
+    @staticmethod
+    def _key(x: int, y: int) -> int:
+        return (x // CELL_SPAN) * _PRIME_X ^ (y // CELL_SPAN) * _PRIME_Y
+
+    def insert(self, position: Position, payload: int) -> None:
+        """Insert a cell with a small integer payload such as an owner id."""
+        self._buckets[self._key(position[0], position[1])][position] = payload
+
+    def remove(self, position: Position) -> None:
+        """Remove a cell if present."""
+        bucket = self._buckets.get(self._key(position[0], position[1]))
+        if bucket is not None:
+            bucket.pop(position, None)
+
+    def candidates(self, position: Position) -> dict[Position, int]:
+        """Return the cells sharing the query position's bucket."""
+        return self._buckets.get(self._key(position[0], position[1]), _EMPTY)
+
+    def clear(self) -> None:
+        """Empty all buckets while keeping their allocations."""
+        for bucket in self._buckets.values():
+            bucket.clear()
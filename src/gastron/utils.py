@@ -64,9 +64,14 @@ def add_direction(position: Position, direction: Direction, step: int = GRID_SIZ
 
 
 def in_bounds(position: Position) -> bool:
-    """Check if a grid cell is inside the playfield."""
+    """Check if a grid cell is inside the playfield.
+
+    For integer coordinates a single sign test on the OR of all four
+    margins replaces the two range checks: any coordinate outside
+    [0, limit) makes one term negative.
+    """
     x, y = position
-    return 0 <= x < SCREEN_WIDTH and 0 <= y < SCREEN_HEIGHT
+    return (x | y | (SCREEN_WIDTH - 1 - x) | (SCREEN_HEIGHT - 1 - y)) >= 0
 
 
 def load_json(path: Path, default: Any) -> Any:
@@ -71,3 +71,81 @@ def test_integration_round_transition_to_game_over(monkeypatch) -> None:
 
     game._simulate_step()
     assert game.state in {GameState.ROUND_OVER, GameState.GAME_OVER}
+
+
+def test_projectile_hit_keeps_shared_trail_cell_occupied() -> None:
+    import os
+    from pathlib import Path
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    from gastron.game import TronGame
+    from gastron.player import Projectile
+    from gastron.utils import GRID_SIZE
+
+    game = TronGame(root=Path.cwd())
+    game.reset_match()
+    p1, p2 = game.players
+
+    # A shielded crossing leaves the same cell in both trails.
+    cell = (500, 300)
+    p1.trail[cell] = None
+    p2.trail[cell] = None
+    game.occupied.add(cell)
+    game.trail_grid.insert(cell, p1.player_id | p2.player_id)
+
+    # P1's projectile steps two cells per tick and lands exactly on it.
+    game.projectiles.append(Projectile(1, (cell[0] - 2 * GRID_SIZE, cell[1]), (1, 0)))
+    game._simulate_step()
+
+    assert cell not in p2.trail
+    assert cell in p1.trail
+    assert cell in game.occupied
+    assert game.trail_grid.candidates(cell).get(cell) == p1.player_id
+
+
+def test_replay_rows_unwraps_ring_buffer() -> None:
+    import os
+    from pathlib import Path
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    import numpy as np
+
+    from gastron.game import REPLAY_CAP, TronGame
+
+    game = TronGame(root=Path.cwd())
+    game.replay_log = np.arange(REPLAY_CAP * 5, dtype=np.int32).reshape(REPLAY_CAP, 5)
+
+    # Not yet wrapped: rows come back verbatim.
+    game._replay_len = 3
+    assert game._replay_rows() == game.replay_log[:3].tolist()
+
+    # Exactly full sits on the boundary: still no unwrap.
+    game._replay_len = REPLAY_CAP
+    assert game._replay_rows() == game.replay_log.tolist()
+
+    # Wrapped by two rows: oldest-first starts just past the wrap point.
+    game._replay_len = REPLAY_CAP + 2
+    rows = game._replay_rows()
+    assert len(rows) == REPLAY_CAP
+    assert rows[0] == game.replay_log[2].tolist()
+    assert rows[-1] == game.replay_log[1].tolist()
+
+
+def test_render_playing_smoke() -> None:
+    import os
+    from pathlib import Path
+
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    from gastron.game import GameState, TronGame
+
+    game = TronGame(root=Path.cwd())
+    game.reset_match()
+    game.state = GameState.PLAYING
+    game._simulate_step()
+    game._render()
@@ -32,8 +32,7 @@ def test_player_next_position() -> None:
 
 def test_trail_eraser_removes_segments() -> None:
     player = _player()
-    player.trail = [(x, 0) for x in range(0, 100, 10)]
-    player.trail_set = set(player.trail)
+    player.trail = {(x, 0): None for x in range(0, 100, 10)}
     player.consume_trail_segment(4)
     assert len(player.trail) == 6
-    assert (0, 0) not in player.trail_set
+    assert (0, 0) not in player.trail
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from gastron.spatial_hash import SpatialHashGrid
+
+
+def test_insert_query_remove_round_trip() -> None:
+    grid = SpatialHashGrid()
+    grid.insert((100, 100), 1)
+    assert grid.candidates((100, 100)).get((100, 100)) == 1
+    grid.remove((100, 100))
+    assert (100, 100) not in grid.candidates((100, 100))
+
+
+def test_candidates_are_local_to_bucket() -> None:
+    grid = SpatialHashGrid()
+    grid.insert((0, 0), 1)
+    assert (0, 0) not in grid.candidates((1000, 600))
+
+
+def test_clear_keeps_grid_usable() -> None:
+    grid = SpatialHashGrid()
+    grid.insert((50, 50), 2)
+    grid.clear()
+    assert (50, 50) not in grid.candidates((50, 50))
+    grid.insert((50, 50), 2)
+    assert grid.candidates((50, 50)).get((50, 50)) == 2
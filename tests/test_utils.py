@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from gastron.utils import GRID_SIZE, SCREEN_HEIGHT, SCREEN_WIDTH, in_bounds
+
+
+def test_in_bounds_edges() -> None:
+    assert in_bounds((0, 0))
+    assert in_bounds((SCREEN_WIDTH - GRID_SIZE, SCREEN_HEIGHT - GRID_SIZE))
+    assert not in_bounds((SCREEN_WIDTH, 0))
+    assert not in_bounds((0, SCREEN_HEIGHT))
+    assert not in_bounds((-GRID_SIZE, 0))
+    assert not in_bounds((0, -GRID_SIZE))
+
+
+def test_in_bounds_matches_range_check() -> None:
+    probes = (-GRID_SIZE, -1, 0, 1, SCREEN_WIDTH - 1, SCREEN_WIDTH, SCREEN_HEIGHT - 1, SCREEN_HEIGHT)
+    for x in probes:
+        for y in probes:
+            expected = 0 <= x < SCREEN_WIDTH and 0 <= y < SCREEN_HEIGHT
+            assert in_bounds((x, y)) == expected